@@ -5,78 +5,242 @@ Advanced analysis and visualization of music project data
 """
 
 import sqlite3
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import hashlib
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import polars as pl
 import numpy as np
 from datetime import datetime, timedelta
-from collections import Counter
 import json
 
+# Parquet snapshots of the loaded tables, keyed on the database fingerprint
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "music_tracker")
+# Bump when the cached columns change so old snapshots are not reused
+CACHE_VERSION = 4
+
+# Columns the analyses actually read, with their Polars dtypes; wide text columns
+# (paths, descriptions, additional_files JSON) are never pulled out of SQLite.
+# Explicit dtypes matter: optional columns like rating/genre/tags are often NULL
+# for the first rows, which Polars' row-sample inference cannot type.
+ANALYSIS_COLUMNS = {
+    'raw_projects': {
+        'id': pl.Int64, 'daw_type': pl.Utf8, 'date_created': pl.Utf8,
+        'date_discovered': pl.Utf8,
+    },
+    'refined_projects': {
+        'id': pl.Int64, 'raw_project_id': pl.Int64, 'genre': pl.Utf8, 'status': pl.Utf8,
+        'rating': pl.Int64, 'tags': pl.Utf8, 'collaboration': pl.Utf8, 'daw_type': pl.Utf8,
+        'file_size_mb': pl.Float64, 'date_created': pl.Utf8,
+    },
+    'rejected_projects': {
+        'id': pl.Int64, 'raw_project_id': pl.Int64, 'daw_type': pl.Utf8,
+        'date_rejected': pl.Utf8,
+    },
+}
+
+# Above this many points, scatter plots are drawn as hexbin density instead
+SCATTER_MAX_POINTS = 5000
+
+# Plotting libraries are imported inside the methods that use them, so importing
+# this module (e.g. just to load data) does not pay matplotlib/seaborn/plotly startup
+def _load_plotly():
+    """Import plotly on first use, serializing figures with orjson when available"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    try:
+        import orjson  # noqa: F401
+        # Serialize figure data for write_html with orjson instead of the stdlib encoder
+        pio.json.config.default_engine = 'orjson'
+    except ImportError:
+        pass
+    return go
+
 class MusicAnalytics:
     def __init__(self, db_path):
         self.db_path = db_path
+        self._conn = None
+        self._conn_lock = threading.Lock()
         self.setup_style()
     
     def setup_style(self):
         """Set up plotting style"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         plt.style.use('dark_background')
         sns.set_palette("husl")
     
+    def _connect(self):
+        """Open (once) the read connection shared by all queries, tuned for bulk scans"""
+        if self._conn is None:
+            # Analyses run on worker threads; access is serialized by _conn_lock
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript('''
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-65536;
+                PRAGMA temp_store=MEMORY;
+            ''')
+        return self._conn
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def load_data(self):
-        """Load data from database into pandas DataFrames"""
-        conn = sqlite3.connect(self.db_path)
-        
-        self.raw_df = pd.read_sql_query('''
-            SELECT *, 'raw' as source FROM raw_projects
-        ''', conn)
-        
-        self.refined_df = pd.read_sql_query('''
-            SELECT *, 'refined' as source FROM refined_projects
-        ''', conn)
-        
-        self.rejected_df = pd.read_sql_query('''
-            SELECT *, 'rejected' as source FROM rejected_projects
-        ''', conn)
-        
-        conn.close()
-        
-        # Convert dates
-        for df in [self.raw_df, self.refined_df]:
-            if 'date_created' in df.columns:
-                df['date_created'] = pd.to_datetime(df['date_created'])
-            if 'date_refined' in df.columns:
-                df['date_refined'] = pd.to_datetime(df['date_refined'])
+        """Load data from database into pandas DataFrames, reusing the parquet cache if unchanged"""
+        db_key = hashlib.blake2b(os.path.abspath(self.db_path).encode(), digest_size=8).hexdigest()
+        fingerprint = self._db_fingerprint()
+        cache_paths = {
+            name: os.path.join(CACHE_DIR, f"{db_key}.{fingerprint}.v{CACHE_VERSION}.{name}.parquet")
+            for name in ('raw', 'refined', 'rejected')
+        }
+        
+        frames = None
+        if all(os.path.exists(path) for path in cache_paths.values()):
+            try:
+                frames = {name: pl.read_parquet(path) for name, path in cache_paths.items()}
+            except Exception as e:
+                # A truncated or corrupt snapshot is rebuilt from the database
+                print(f"Ignoring unreadable analytics cache: {e}")
+        
+        if frames is None:
+            frames = self._read_tables()
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                # Drop snapshots of older versions of this database
+                for stale in glob.glob(os.path.join(CACHE_DIR, f"{db_key}.*.parquet")):
+                    os.remove(stale)
+                for name, df in frames.items():
+                    # Write aside and rename so readers never see a partial file
+                    tmp_path = f"{cache_paths[name]}.{os.getpid()}.tmp"
+                    df.write_parquet(tmp_path, compression='zstd')
+                    os.replace(tmp_path, cache_paths[name])
+            except OSError as e:
+                print(f"Could not write analytics cache: {e}")
+        
+        # Cross into pandas once
+        self.raw_df = frames['raw'].to_pandas()
+        self.refined_df = frames['refined'].to_pandas()
+        self.rejected_df = frames['rejected'].to_pandas()
+        
+        self._add_derived_columns()
+    
+    def _add_derived_columns(self):
+        """Encode low-cardinality columns and compute non-null masks once for all analyses"""
+        for col in ('genre', 'daw_type', 'status'):
+            self.refined_df[col] = self.refined_df[col].astype('category')
+        
+        self._nonnull = {
+            col: self.refined_df[col].notna().values
+            for col in ('genre', 'rating', 'collaboration', 'tags')
+        }
+    
+    def _db_fingerprint(self):
+        """Short hash of the database (and non-empty WAL file) mtime and size"""
+        stamp = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            if os.path.exists(path):
+                st = os.stat(path)
+                # Every connection recreates an empty WAL, which says nothing about the data
+                if path.endswith('-wal') and st.st_size == 0:
+                    continue
+                stamp.append(f"{st.st_mtime_ns}:{st.st_size}")
+        return hashlib.blake2b("|".join(stamp).encode(), digest_size=8).hexdigest()
+    
+    def _read_tables(self):
+        """Read the three project tables from SQLite as Polars DataFrames"""
+        raw = self._read_columns('raw_projects')
+        refined = self._read_columns('refined_projects')
+        rejected = self._read_columns('rejected_projects')
+        
+        # Convert dates in Polars so cached snapshots skip reparsing
+        refined = self._parse_dates(refined)
+        # Store the creation year with the snapshot instead of re-deriving it per load;
+        # 'year' already exists in refined_projects (user metadata), so use a distinct name
+        refined = refined.with_columns(
+            pl.col('date_created').cast(pl.Datetime, strict=False).dt.year().cast(pl.Int16).alias('created_year')
+        )
+        return {
+            'raw': self._parse_dates(raw),
+            'refined': refined,
+            'rejected': rejected,
+        }
+    
+    def _read_columns(self, table):
+        """Read only the analysed columns of a table"""
+        schema = ANALYSIS_COLUMNS[table]
+        columns = ', '.join(schema)
+        return pl.read_database(f'SELECT {columns} FROM {table}', self._connect(),
+                                schema_overrides=schema, infer_schema_length=None)
+    
+    @staticmethod
+    def _parse_dates(df):
+        """Parse SQLite date strings into datetimes"""
+        date_cols = [c for c in ('date_created', 'date_refined')
+                     if c in df.columns and df.schema[c] == pl.Utf8]
+        if not date_cols:
+            return df
+        return df.with_columns([pl.col(c).str.to_datetime(strict=False) for c in date_cols])
+    
+    def _sql(self, query):
+        """Run an aggregate query in SQLite and return the (small) result as a DataFrame"""
+        with self._conn_lock:
+            # Infer from every row: aggregate columns may start with NULLs
+            return pl.read_database(query, self._connect(),
+                                    infer_schema_length=None).to_pandas()
     
     def productivity_timeline(self):
         """Create timeline showing productivity over time"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10))
-        
-        # Monthly productivity
-        monthly = self.refined_df.groupby(self.refined_df['date_created'].dt.to_period('ME')).size()
-        monthly.plot(kind='line', ax=ax1, marker='o', linewidth=2)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        # Standalone Figure (no pyplot registry) so analyses can render concurrently
+        fig = Figure(figsize=(15, 10), dpi=300, constrained_layout=True)
+        ax1, ax2 = fig.subplots(2, 1)
+        
+        # Monthly productivity (bucketed in SQLite as absolute month numbers)
+        buckets = self._sql('''
+            SELECT CAST(strftime('%Y', date_created) AS INTEGER) * 12
+                   + CAST(strftime('%m', date_created) AS INTEGER) - 1 AS month_num,
+                   COUNT(*) AS projects
+            FROM refined_projects
+            WHERE date_created IS NOT NULL
+            GROUP BY month_num
+        ''')
+        month_num = buckets['month_num'].to_numpy()
+        first_month = month_num.min()
+        # Dense per-month counts (empty months included) without Period objects
+        counts = np.bincount(month_num - first_month,
+                             weights=buckets['projects'].to_numpy()).astype(np.int64)
+        cumulative = counts.cumsum()
+        months = (np.datetime64('1970-01', 'M') + (first_month - 1970 * 12)
+                  + np.arange(len(counts))).astype('datetime64[D]')
+        
+        ax1.plot(months, counts, marker='o', linewidth=2)
         ax1.set_title('Monthly Music Productivity', fontsize=16, pad=20)
         ax1.set_ylabel('Projects Created')
         ax1.grid(True, alpha=0.3)
         
         # Cumulative projects over time
-        cumulative = self.refined_df.set_index('date_created').resample('ME').size().cumsum()
-        cumulative.plot(kind='area', ax=ax2, alpha=0.7)
+        ax2.fill_between(months, cumulative, alpha=0.7)
         ax2.set_title('Cumulative Music Projects', fontsize=16, pad=20)
         ax2.set_ylabel('Total Projects')
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig('productivity_timeline.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        FigureCanvasAgg(fig).print_png('productivity_timeline.png')
     
     def genre_analysis(self):
         """Analyze genre distribution and evolution"""
+        from plotly.subplots import make_subplots
+        go = _load_plotly()
+        
         # Filter out null genres
-        genre_data = self.refined_df[self.refined_df['genre'].notna()]
+        genre_data = self.refined_df.loc[self._nonnull['genre']]
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -92,14 +256,16 @@ class MusicAnalytics:
                             name="Genres"), row=1, col=1)
         
         # Genre vs Rating box plot
-        for genre in genre_data['genre'].unique()[:8]:  # Top 8 genres
-            genre_ratings = genre_data[genre_data['genre'] == genre]['rating']
-            fig.add_trace(go.Box(y=genre_ratings, name=genre), row=1, col=2)
+        top8 = genre_counts.head(8).index  # Top 8 genres
+        ratings_by_genre = dict(list(genre_data[genre_data['genre'].isin(top8)].groupby('genre', observed=True)['rating']))
+        for genre in top8:
+            fig.add_trace(go.Box(y=ratings_by_genre[genre].values, name=genre), row=1, col=2)
         
         # Genre evolution over time
-        genre_data['year'] = genre_data['date_created'].dt.year
-        for genre in genre_counts.head(5).index:  # Top 5 genres
-            yearly_data = genre_data[genre_data['genre'] == genre].groupby('year').size()
+        top5 = genre_counts.head(5).index  # Top 5 genres
+        yearly_by_genre = genre_data.groupby(['genre', 'created_year'], observed=True).size().unstack(0).reindex(columns=top5)
+        for genre in top5:
+            yearly_data = yearly_by_genre[genre].dropna()
             fig.add_trace(go.Scatter(x=yearly_data.index, y=yearly_data.values,
                                    mode='lines+markers', name=genre), row=2, col=1)
         
@@ -110,10 +276,11 @@ class MusicAnalytics:
         fig.update_layout(height=800, showlegend=True, 
                           title_text="Genre Analysis Dashboard", title_x=0.5)
         fig.write_html('genre_analysis.html')
-        fig.show()
     
     def completion_funnel(self):
         """Analyze project completion rates"""
+        go = _load_plotly()
+        
         # Get status distribution
         status_counts = self.refined_df['status'].value_counts()
         
@@ -131,13 +298,13 @@ class MusicAnalytics:
         )
         
         fig.write_html('completion_funnel.html')
-        fig.show()
         
         # Completion rate by DAW
-        completion_by_daw = self.refined_df.groupby('daw_type').agg({
-            'status': ['count', lambda x: (x == 'complete').sum()]
-        }).round(2)
-        completion_by_daw.columns = ['Total', 'Completed']
+        completion_by_daw = self._sql('''
+            SELECT daw_type, COUNT(status) AS Total, SUM(status = 'complete') AS Completed
+            FROM refined_projects
+            GROUP BY daw_type
+        ''').set_index('daw_type')
         completion_by_daw['Completion_Rate'] = (completion_by_daw['Completed'] / completion_by_daw['Total'] * 100).round(1)
         
         print("Completion Rate by DAW:")
@@ -145,18 +312,28 @@ class MusicAnalytics:
     
     def rating_analysis(self):
         """Analyze project ratings and what makes a high-rated project"""
-        rated_projects = self.refined_df[self.refined_df['rating'].notna()]
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        import seaborn as sns
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        rated_projects = self.refined_df.loc[self._nonnull['rating']]
+        
+        fig = Figure(figsize=(15, 12), dpi=300, constrained_layout=True)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Rating distribution
-        rated_projects['rating'].hist(bins=10, ax=ax1, edgecolor='white', alpha=0.7)
+        counts, edges = np.histogram(rated_projects['rating'].to_numpy(), bins=10)
+        ax1.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='white', alpha=0.7)
         ax1.set_title('Rating Distribution')
         ax1.set_xlabel('Rating (1-10)')
         ax1.set_ylabel('Number of Projects')
         
         # Rating vs File Size
-        ax2.scatter(rated_projects['file_size_mb'], rated_projects['rating'], alpha=0.6)
+        if len(rated_projects) > SCATTER_MAX_POINTS:
+            ax2.hexbin(rated_projects['file_size_mb'], rated_projects['rating'],
+                       gridsize=40, cmap='viridis', mincnt=1, rasterized=True)
+        else:
+            ax2.scatter(rated_projects['file_size_mb'], rated_projects['rating'], alpha=0.6)
         ax2.set_xlabel('File Size (MB)')
         ax2.set_ylabel('Rating')
         ax2.set_title('Rating vs File Size')
@@ -167,96 +344,121 @@ class MusicAnalytics:
         ax3.tick_params(axis='x', rotation=45)
         
         # Rating over time
-        monthly_rating = rated_projects.groupby(rated_projects['date_created'].dt.to_period('M'))['rating'].mean()
+        monthly_rating = self._sql('''
+            SELECT strftime('%Y-%m', date_created) AS month, AVG(rating) AS rating
+            FROM refined_projects
+            WHERE rating IS NOT NULL AND date_created IS NOT NULL
+            GROUP BY month ORDER BY month
+        ''').set_index('month')['rating']
+        monthly_rating.index = pd.PeriodIndex(monthly_rating.index, freq='M')
         monthly_rating.plot(ax=ax4, marker='o')
         ax4.set_title('Average Rating Over Time')
         ax4.set_ylabel('Average Rating')
         
-        plt.tight_layout()
-        plt.savefig('rating_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        FigureCanvasAgg(fig).print_png('rating_analysis.png')
     
     def collaboration_network(self):
         """Analyze collaborations"""
-        collab_data = self.refined_df[self.refined_df['collaboration'].notna()]
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        collab_data = self.refined_df.loc[self._nonnull['collaboration']]
         
         if len(collab_data) == 0:
             print("No collaboration data found")
             return
         
         # Parse collaborators
-        all_collabs = []
-        for collab_str in collab_data['collaboration']:
-            if collab_str:
-                collabs = [c.strip() for c in collab_str.split(',')]
-                all_collabs.extend(collabs)
-        
-        collab_counts = Counter(all_collabs)
+        collab_strs = collab_data['collaboration']
+        collab_counts = collab_strs[collab_strs != ''].str.split(',').explode().str.strip().value_counts()
         
         # Top collaborators
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig = Figure(figsize=(15, 6), dpi=300, constrained_layout=True)
+        ax1, ax2 = fig.subplots(1, 2)
         
-        top_collabs = dict(collab_counts.most_common(10))
-        ax1.bar(top_collabs.keys(), top_collabs.values())
+        top_collabs = collab_counts.head(10)
+        ax1.bar(top_collabs.index, top_collabs.values)
         ax1.set_title('Top Collaborators')
         ax1.tick_params(axis='x', rotation=45)
         
         # Collaboration frequency over time
-        collab_data['year'] = collab_data['date_created'].dt.year
-        yearly_collabs = collab_data.groupby('year').size()
+        yearly_collabs = self._sql('''
+            SELECT CAST(strftime('%Y', date_created) AS INTEGER) AS year, COUNT(*) AS projects
+            FROM refined_projects
+            WHERE collaboration IS NOT NULL AND date_created IS NOT NULL
+            GROUP BY year ORDER BY year
+        ''').set_index('year')['projects']
         yearly_collabs.plot(kind='bar', ax=ax2)
         ax2.set_title('Collaborations by Year')
         ax2.set_ylabel('Number of Collaborative Projects')
         
-        plt.tight_layout()
-        plt.savefig('collaboration_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        FigureCanvasAgg(fig).print_png('collaboration_analysis.png')
     
     def tag_analysis(self):
         """Analyze tags and their relationships"""
-        tagged_projects = self.refined_df[self.refined_df['tags'].notna()]
+        from matplotlib import colormaps
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        tagged_projects = self.refined_df.loc[self._nonnull['tags']]
         
         if len(tagged_projects) == 0:
             print("No tag data found")
             return
         
-        # Parse tags
-        all_tags = []
-        for tag_str in tagged_projects['tags']:
-            if tag_str:
-                try:
-                    tags = json.loads(tag_str) if tag_str.startswith('[') else tag_str.split(',')
-                    all_tags.extend([t.strip() for t in tags])
-                except:
-                    tags = tag_str.split(',')
-                    all_tags.extend([t.strip() for t in tags])
+        # Parse tags: JSON arrays (as stored by refine) and legacy comma-separated strings
+        tag_strs = tagged_projects['tags']
+        tag_strs = tag_strs[tag_strs != '']
+        is_json = tag_strs.str.startswith('[')
+        json_tags = self._decode_json_tags(tag_strs[is_json]).explode()
+        csv_tags = tag_strs[~is_json].str.split(',').explode()
+        all_tags = pd.concat([json_tags, csv_tags]).dropna().astype(str).str.strip()
         
-        tag_counts = Counter(all_tags)
+        tag_counts = all_tags.value_counts()
         
         # Tag frequency
-        top_tags = dict(tag_counts.most_common(20))
+        top_tags = tag_counts.head(20)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig = Figure(figsize=(15, 6), dpi=300, constrained_layout=True)
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Tag bar chart
-        ax1.barh(list(top_tags.keys()), list(top_tags.values()))
+        ax1.barh(top_tags.index, top_tags.values)
         ax1.set_title('Most Used Tags')
         ax1.set_xlabel('Frequency')
         
         # Tag word cloud effect (bar chart styled)
-        sizes = list(top_tags.values())
-        colors = plt.cm.viridis(np.linspace(0, 1, len(top_tags)))
+        sizes = top_tags.values
+        colors = colormaps['viridis'](np.linspace(0, 1, len(top_tags)))
         ax2.bar(range(len(top_tags)), sizes, color=colors)
         ax2.set_xticks(range(len(top_tags)))
-        ax2.set_xticklabels(list(top_tags.keys()), rotation=45, ha='right')
+        ax2.set_xticklabels(top_tags.index, rotation=45, ha='right')
         ax2.set_title('Tag Cloud (Frequency)')
         
-        plt.tight_layout()
-        plt.savefig('tag_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        FigureCanvasAgg(fig).print_png('tag_analysis.png')
+    
+    @staticmethod
+    def _decode_json_tags(json_tags):
+        """Decode a Series of JSON tag arrays with a single json.loads call"""
+        try:
+            decoded = json.loads('[' + ','.join(json_tags) + ']')
+        except ValueError:
+            decoded = None
+        if decoded is None or len(decoded) != len(json_tags):
+            # A malformed row spoils the batch (or shifts it, e.g. '["a"],["b"]' in one row);
+            # decode row by row, comma-splitting bad rows
+            decoded = []
+            for tag_str in json_tags:
+                try:
+                    decoded.append(json.loads(tag_str))
+                except ValueError:
+                    decoded.append(tag_str.split(','))
+        return pd.Series(decoded, index=json_tags.index, dtype=object)
     
     def project_lifecycle_analysis(self):
         """Analyze how projects move through the system"""
+        go = _load_plotly()
+        
         total_raw = len(self.raw_df)
         total_refined = len(self.refined_df)
         total_rejected = len(self.rejected_df)
@@ -283,7 +485,6 @@ class MusicAnalytics:
         
         fig.update_layout(title_text="Project Lifecycle Flow", font_size=10)
         fig.write_html('project_lifecycle.html')
-        fig.show()
     
     def generate_report(self):
         """Generate comprehensive analytics report"""
@@ -307,57 +508,32 @@ class MusicAnalytics:
         
         print("\n🎯 Generating Visualizations...")
         
-        # Generate all analyses
-        try:
-            self.productivity_timeline()
-            print("   ✓ Productivity timeline created")
-        except Exception as e:
-            print(f"   ✗ Productivity timeline failed: {e}")
-        
-        try:
-            self.genre_analysis()
-            print("   ✓ Genre analysis created")
-        except Exception as e:
-            print(f"   ✗ Genre analysis failed: {e}")
-        
-        try:
-            self.completion_funnel()
-            print("   ✓ Completion funnel created")
-        except Exception as e:
-            print(f"   ✗ Completion funnel failed: {e}")
-        
-        try:
-            self.rating_analysis()
-            print("   ✓ Rating analysis created")
-        except Exception as e:
-            print(f"   ✗ Rating analysis failed: {e}")
-        
-        try:
-            self.collaboration_network()
-            print("   ✓ Collaboration analysis created")
-        except Exception as e:
-            print(f"   ✗ Collaboration analysis failed: {e}")
-        
-        try:
-            self.tag_analysis()
-            print("   ✓ Tag analysis created")
-        except Exception as e:
-            print(f"   ✗ Tag analysis failed: {e}")
-        
-        try:
-            self.project_lifecycle_analysis()
-            print("   ✓ Project lifecycle analysis created")
-        except Exception as e:
-            print(f"   ✗ Project lifecycle analysis failed: {e}")
+        # Generate all analyses; each writes its own file, so render them concurrently
+        steps = [
+            ("Productivity timeline", self.productivity_timeline, "productivity_timeline.png"),
+            ("Genre analysis", self.genre_analysis, "genre_analysis.html"),
+            ("Completion funnel", self.completion_funnel, "completion_funnel.html"),
+            ("Rating analysis", self.rating_analysis, "rating_analysis.png"),
+            ("Collaboration analysis", self.collaboration_network, "collaboration_analysis.png"),
+            ("Tag analysis", self.tag_analysis, "tag_analysis.png"),
+            ("Project lifecycle analysis", self.project_lifecycle_analysis, "project_lifecycle.html"),
+        ]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(fn) for _, fn, _ in steps]
+        
+        for (name, _, _), future in zip(steps, futures):
+            try:
+                future.result()
+                print(f"   ✓ {name} created")
+            except Exception as e:
+                print(f"   ✗ {name} failed: {e}")
+        
+        self.close()
         
         print("\n🎉 Analytics complete! Check generated files:")
-        print("   - productivity_timeline.png")
-        print("   - genre_analysis.html")
-        print("   - completion_funnel.html")
-        print("   - rating_analysis.png")
-        print("   - collaboration_analysis.png")
-        print("   - tag_analysis.png")
-        print("   - project_lifecycle.html")
+        for _, _, filename in steps:
+            print(f"   - {filename}")
 
 
 if __name__ == "__main__":
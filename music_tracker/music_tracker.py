@@ -5,42 +5,193 @@ Tracks DAW projects across multiple stages: raw discovery -> refined catalog ->
 Version: 1.1.0
 """
 
-import sqlite3
 import os
-import argparse
+import re
+import functools
 import json
-import subprocess
-import platform
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import sys
 
+if TYPE_CHECKING:
+    # Annotations only; sqlite3 itself is imported in _connect
+    import sqlite3
+
 __version__ = "1.1.0"
 
+# Resolved once at import; it does not change during a run. sys.platform gives the
+# same answer as platform.system() here without importing the platform module.
+_SYSTEM = {'darwin': 'Darwin', 'win32': 'Windows'}.get(sys.platform, 'Linux')
+
+# Stored in PRAGMA user_version once setup_database has created the schema;
+# bump when tables or indexes change so existing databases get migrated
+SCHEMA_VERSION = 2
+
+# Directory names containing any of these are backup/temp folders and are not scanned
+SKIP_DIR_TOKENS = (
+    'auto-backup',
+    'auto-save',
+    'backup',
+    'temp',
+    'tmp',
+    '.backup',
+    '_backup',
+    'autosave',
+    'recovery'
+)
+
+# Backup-like patterns in project file names
+BACKUP_FILENAME_PATTERNS = (
+    ' [20',  # Bitwig backup format: "project [2024-05-25 151417].bwproject"
+    '.bak',
+    '_bak',
+    '.backup',
+    '_backup',
+    '~',
+    '.tmp'
+)
+
+# Precompiled matchers (applied to lowercased names): one regex search instead of
+# a Python-level substring test per pattern
+_SKIP_DIR_RE = re.compile('|'.join(map(re.escape, SKIP_DIR_TOKENS)))
+_SKIP_FILE_RE = re.compile('|'.join(map(re.escape, SKIP_DIR_TOKENS + BACKUP_FILENAME_PATTERNS)))
+
+# Columns returned by show_project_details for each source table
+RAW_DETAIL_COLUMNS = (
+    'id', 'project_file_path', 'project_folder_path', 'daw_type', 'detected_title',
+    'file_size_mb', 'date_created', 'date_modified', 'date_discovered',
+    'additional_files', 'notes'
+)
+REFINED_DETAIL_COLUMNS = (
+    'id', 'raw_project_id', 'title', 'description', 'genre', 'bpm', 'key_signature',
+    'year', 'status', 'rating', 'tags', 'collaboration', 'project_file_path',
+    'project_folder_path', 'daw_type', 'file_size_mb', 'date_created', 'date_refined'
+)
+
+def _detail_select(table: str, source: str, columns: Tuple[str, ...]) -> str:
+    """SELECT over one table padded with NULLs to the combined detail columns,
+    so raw and refined rows can be looked up in a single UNION ALL"""
+    combined = RAW_DETAIL_COLUMNS + tuple(c for c in REFINED_DETAIL_COLUMNS if c not in RAW_DETAIL_COLUMNS)
+    select = ', '.join(c if c in columns else f'NULL AS {c}' for c in combined)
+    return f"SELECT '{source}' AS source_table, {select} FROM {table}"
+
+# Raw matches win over refined ones: 'raw' sorts before 'refined'
+_DETAILS_BY_ID_SQL = f'''
+    {_detail_select('raw_projects', 'raw', RAW_DETAIL_COLUMNS)} WHERE id = ?
+    UNION ALL
+    {_detail_select('refined_projects', 'refined', REFINED_DETAIL_COLUMNS)} WHERE id = ?
+    ORDER BY source_table LIMIT 1
+'''
+_DETAILS_BY_TITLE_SQL = f'''
+    SELECT * FROM ({_detail_select('raw_projects', 'raw', RAW_DETAIL_COLUMNS)}
+                   WHERE detected_title LIKE ? ORDER BY date_discovered DESC LIMIT 1)
+    UNION ALL
+    SELECT * FROM ({_detail_select('refined_projects', 'refined', REFINED_DETAIL_COLUMNS)}
+                   WHERE title LIKE ? ORDER BY date_refined DESC LIMIT 1)
+    ORDER BY source_table LIMIT 1
+'''
+
+def _config_dir() -> Path:
+    """Platform-appropriate config directory holding the default database"""
+    # Looked up here rather than at import: Path.home() raises when no home
+    # directory can be resolved, which must not break --db or --help
+    home = Path.home()
+    if _SYSTEM == "Darwin":  # macOS
+        return home / "Library" / "Application Support" / "MusicTracker"
+    elif _SYSTEM == "Windows":
+        return home / "AppData" / "Local" / "MusicTracker"
+    else:  # Linux
+        return home / ".config" / "music-tracker"
+
+@functools.lru_cache(maxsize=None)
+def _resolve_opener() -> Optional[str]:
+    """Full path of the system's default-program launcher, looked up on PATH once"""
+    import shutil
+    return shutil.which("open" if _SYSTEM == "Darwin" else "xdg-open")
+
+def _list_raw_sql(daw_filter: bool, keyset: bool) -> str:
+    """SQL for list_raw_projects with the given optional filters"""
+    query = '''
+        SELECT r.id, r.detected_title AS title, r.daw_type AS daw, r.file_size_mb AS size_mb,
+               r.date_created AS created, r.project_file_path AS path
+        FROM raw_projects r
+        LEFT JOIN refined_projects ref ON ref.raw_project_id = r.id
+        LEFT JOIN rejected_projects rej ON rej.raw_project_id = r.id
+        WHERE ref.id IS NULL AND rej.id IS NULL
+    '''
+    
+    if daw_filter:
+        query += ' AND r.daw_type LIKE ?'
+    
+    if keyset:
+        # Rows sorting after the given project; a range on idx_raw_discovered,
+        # whose entries are (date_discovered DESC, id ASC) like the ORDER BY
+        query += '''
+            AND r.date_discovered <= (SELECT date_discovered FROM raw_projects WHERE id = ?)
+            AND (r.date_discovered < (SELECT date_discovered FROM raw_projects WHERE id = ?)
+                 OR r.id > ?)
+        '''
+    
+    return query + ' ORDER BY r.date_discovered DESC, r.id LIMIT ? OFFSET ?'
+
+# (has DAW filter, has after_id) -> statement text, built once at import
+_LIST_RAW_SQL = {
+    (daw_filter, keyset): _list_raw_sql(daw_filter, keyset)
+    for daw_filter in (False, True) for keyset in (False, True)
+}
+
 class MusicTracker:
     def __init__(self, db_path: str = None):
         if db_path is None:
             # Use platform-appropriate config directory
-            if platform.system() == "Darwin":  # macOS
-                config_dir = Path.home() / "Library" / "Application Support" / "MusicTracker"
-            elif platform.system() == "Windows":
-                config_dir = Path.home() / "AppData" / "Local" / "MusicTracker"
-            else:  # Linux
-                config_dir = Path.home() / ".config" / "music-tracker"
+            config_dir = _config_dir()
             
             # Create directory if it doesn't exist
             config_dir.mkdir(parents=True, exist_ok=True)
             self.db_path = str(config_dir / "music_tracker.db")
         else:
             self.db_path = db_path
-            
-        self.setup_database()
+        
+        # One long-lived connection for the lifetime of the tracker
+        self._conn = self._connect()
+        # show_project_details results, keyed by identifier; only set (to a dict)
+        # while interactive_review runs, so scripted calls always read fresh rows
+        self._details_cache = None
+        # Reading user_version takes no write lock, so an existing database skips
+        # the CREATE statements and their write transaction entirely
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            self.setup_database()
+    
+    def _connect(self) -> 'sqlite3.Connection':
+        """Open a database connection with per-connection performance pragmas"""
+        # Imported here rather than at module level so `version` and help output,
+        # which never open the database, don't pay for loading sqlite3
+        import sqlite3
+        
+        # The connection's statement cache is keyed on SQL text; the queries below use
+        # fixed text with ? parameters, so repeated calls skip re-preparing
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
+        # Rows support both index and column-name access without building a dict per row
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')  # safe with WAL, far fewer fsyncs
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        return conn
+    
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def setup_database(self):
         """Initialize all three database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        
+        # WAL is persistent in the database file, so setting it here covers every connection
+        cursor.execute('PRAGMA journal_mode=WAL')
         
         # Raw projects table - unprocessed discoveries
         cursor.execute('''
@@ -98,17 +249,27 @@ class MusicTracker:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Indexes for the unprocessed-project anti-join and the listing sort orders
+        cursor.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_refined_raw ON refined_projects(raw_project_id);
+            CREATE INDEX IF NOT EXISTS idx_rejected_raw ON rejected_projects(raw_project_id);
+            CREATE INDEX IF NOT EXISTS idx_refined_date ON refined_projects(date_refined DESC);
+            CREATE INDEX IF NOT EXISTS idx_raw_discovered ON raw_projects(date_discovered DESC);
+            CREATE INDEX IF NOT EXISTS idx_raw_daw ON raw_projects(daw_type);
+            CREATE INDEX IF NOT EXISTS idx_refined_daw ON refined_projects(daw_type);
+        ''')
+        
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._conn.commit()
     
     def detect_daw_projects(self, directory: str) -> List[Dict]:
         """Scan directory for DAW project files and return project info"""
-        projects = []
-        directory_path = Path(directory)
+        # Paths stay plain strings for the whole scan; PathLike input is accepted
+        directory = os.fspath(directory)
         
-        if not directory_path.exists():
+        if not os.path.exists(directory):
             print(f"❌ Directory not found: {directory}")
-            return projects
+            return []
         
         # Define DAW project patterns
         daw_patterns = {
@@ -118,116 +279,173 @@ class MusicTracker:
             '.bwproject': 'Bitwig'
         }
         
+        extensions = tuple(daw_patterns)
+        # Normalize once so stored paths match what Path() used to produce
+        directory = os.path.normpath(directory)
+        
         print(f"Scanning {directory} for DAW projects...")
         
-        for pattern, daw_name in daw_patterns.items():
-            for project_file in directory_path.rglob(f"*{pattern}"):
-                # Skip backup files and temporary files
-                if self._should_skip_file(project_file):
-                    continue
-                    
-                project_info = self._analyze_project_file(project_file, daw_name, pattern)
-                if project_info:
-                    projects.append(project_info)
+        # Directory listings recorded by the walker, reused by the Logic sibling check
+        dir_listings = {}
+        
+        # Entries directly under the root are handled here; top-level subdirectories
+        # are collected and scanned in parallel, since the walk is syscall-bound
+        # and the GIL is released while waiting on the filesystem
+        subdirs = []
+        top_entries = self._scandir_recursive(directory, extensions, dir_listings, subdirs)
+        projects = self._collect_projects(top_entries, daw_patterns, dir_listings)
+        
+        if subdirs:
+            # Imported here: most commands never scan, and the import isn't free
+            from concurrent.futures import ThreadPoolExecutor
+            
+            def scan_subtree(path):
+                entries = self._scandir_recursive(path, extensions, dir_listings)
+                return self._collect_projects(entries, daw_patterns, dir_listings)
+            
+            with ThreadPoolExecutor(max_workers=min(len(subdirs), os.cpu_count() or 4)) as executor:
+                for subtree_projects in executor.map(scan_subtree, subdirs):
+                    projects.extend(subtree_projects)
         
         return projects
     
-    def _should_skip_file(self, project_file: Path) -> bool:
-        """Check if we should skip this project file (backups, temps, etc.)"""
-        file_path_str = str(project_file).lower()
-        
-        # Skip common backup/temp directories
-        skip_patterns = [
-            'auto-backup',
-            'auto-save',
-            'backup',
-            'temp',
-            'tmp',
-            '.backup',
-            '_backup',
-            'autosave',
-            'recovery'
-        ]
-        
-        # Check if any parent directory matches backup patterns
-        for part in project_file.parts:
-            if any(pattern in part.lower() for pattern in skip_patterns):
-                return True
-        
-        # Skip files with backup-like patterns in filename
-        filename = project_file.name.lower()
-        backup_filename_patterns = [
-            ' [20',  # Bitwig backup format: "project [2024-05-25 151417].bwproject"
-            '.bak',
-            '_bak',
-            '.backup',
-            '_backup',
-            '~',
-            '.tmp'
-        ]
-        
-        if any(pattern in filename for pattern in backup_filename_patterns):
-            return True
+    def _collect_projects(self, entries, daw_patterns: Dict[str, str],
+                          dir_listings: Dict[str, List[str]]) -> List[Dict]:
+        """Classify walker entries by extension and analyze the project files"""
+        projects = []
+        for entry in entries:
+            # Lowercase once; both the extension lookup and the skip regex use it
+            lower_name = entry.name.lower()
+            pattern = os.path.splitext(lower_name)[1]
+            daw_name = daw_patterns.get(pattern)
+            if daw_name is None:
+                continue
+            
+            # Skip backup files and temporary files
+            if self._should_skip_file(lower_name):
+                continue
+            
+            project_info = self._analyze_project_entry(entry, daw_name, pattern, dir_listings)
+            if project_info:
+                projects.append(project_info)
         
-        return False
+        return projects
     
-    def _analyze_project_file(self, project_file: Path, daw_name: str, extension: str) -> Optional[Dict]:
+    def _scandir_recursive(self, path: str, bundle_extensions: Tuple[str, ...],
+                           dir_listings: Optional[Dict[str, List[str]]] = None,
+                           deferred_dirs: Optional[List[str]] = None):
+        """Yield DirEntry objects for all files under path, plus project bundle
+        directories (e.g. .logicx packages), which are not descended into.
+        If dir_listings is given, each directory's entry names are stored in it.
+        If deferred_dirs is given, subdirectories of path are appended to it
+        instead of being walked."""
+        try:
+            # Read the whole directory up front so no file handle stays open while recursing
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        
+        if dir_listings is not None:
+            dir_listings[path] = [entry.name for entry in entries]
+        
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name.lower()
+                    # Prune backup/temp folders before descending into them
+                    if _SKIP_DIR_RE.search(name):
+                        continue
+                    if name.endswith(bundle_extensions):
+                        yield entry
+                    elif deferred_dirs is not None:
+                        deferred_dirs.append(entry.path)
+                    else:
+                        yield from self._scandir_recursive(entry.path, bundle_extensions, dir_listings)
+                elif entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+    
+    def _should_skip_file(self, lower_name: str) -> bool:
+        """Check if we should skip this project file (backups, temps, etc.),
+        given its already-lowercased file name"""
+        # Backup/temp parent directories are already pruned during the walk,
+        # so only the file's own name needs checking, with one combined regex
+        return _SKIP_FILE_RE.search(lower_name) is not None
+    
+    def _analyze_project_entry(self, entry: os.DirEntry, daw_name: str, extension: str,
+                               dir_listings: Optional[Dict[str, List[str]]] = None) -> Optional[Dict]:
         """Analyze individual project file and determine title/folder structure"""
+        # Plain string path handling; no Path objects in the per-file hot path
+        project_file = entry.path
+        file_name = entry.name
+        file_stem = file_name[:-len(extension)]
         try:
-            file_stat = project_file.stat()
+            # DirEntry caches its stat result, so the walk doesn't stat each file twice
+            file_stat = entry.stat()
             file_size_mb = file_stat.st_size / (1024 * 1024)
             
+            # Dates are formatted straight to the ISO strings SQLite stores
             # On macOS, get the actual creation time using birthtime
             try:
                 if hasattr(file_stat, 'st_birthtime'):
                     # macOS/BSD - use birth time (actual creation time)
-                    date_created = datetime.fromtimestamp(file_stat.st_birthtime).date()
+                    date_created = time.strftime('%Y-%m-%d', time.localtime(file_stat.st_birthtime))
                 else:
                     # Linux/Windows fallback
-                    date_created = datetime.fromtimestamp(file_stat.st_ctime).date()
-            except (OSError, ValueError):
+                    date_created = time.strftime('%Y-%m-%d', time.localtime(file_stat.st_ctime))
+            except (OSError, ValueError, OverflowError):
                 # Fallback if birthtime fails
-                date_created = datetime.fromtimestamp(file_stat.st_ctime).date()
+                date_created = time.strftime('%Y-%m-%d', time.localtime(file_stat.st_ctime))
             
-            date_modified = datetime.fromtimestamp(file_stat.st_mtime).date()
+            date_modified = time.strftime('%Y-%m-%d', time.localtime(file_stat.st_mtime))
             
             project_folder = None
-            detected_title = project_file.stem
+            detected_title = file_stem
             
             # Determine if project is in a dedicated folder
             if extension in ['.song', '.bwproject']:
                 # These are always in project folders
-                project_folder = project_file.parent
+                project_folder = os.path.dirname(project_file)
                 # Use folder name as title
-                detected_title = project_folder.name
+                detected_title = os.path.basename(project_folder)
             
             elif extension == '.logicx':
                 # Logic projects might be in folders or standalone packages
-                parent_dir = project_file.parent
+                parent_dir = os.path.dirname(project_file)
+                parent_name = os.path.basename(parent_dir)
+                siblings = dir_listings.get(parent_dir) if dir_listings else None
+                if siblings is None:
+                    siblings = os.listdir(parent_dir)
                 # If parent folder name suggests it's a project folder
-                if (parent_dir.name == project_file.stem or
-                    any(sibling.name.startswith(project_file.stem) for sibling in parent_dir.iterdir() if sibling != project_file)):
+                if (parent_name == file_stem or
+                    any(sibling.startswith(file_stem) for sibling in siblings if sibling != file_name)):
                     project_folder = parent_dir
-                    detected_title = parent_dir.name
+                    detected_title = parent_name
             
             # FLP files are usually standalone, no special folder logic needed
             
             # Find additional files in project folder
             additional_files = []
             if project_folder:
-                for item in project_folder.iterdir():
-                    if item != project_file and item.is_file() and not item.name.startswith('.'):
-                        additional_files.append(item.name)
+                # Name checks first; is_file() without symlink following uses the
+                # d_type from the directory listing instead of a stat() per entry
+                with os.scandir(project_folder) as it:
+                    additional_files = [item.name for item in it
+                                        if item.name != file_name
+                                        and not item.name.startswith('.')
+                                        and item.is_file(follow_symlinks=False)]
             
             return {
-                'project_file_path': str(project_file),
-                'project_folder_path': str(project_folder) if project_folder else None,
+                'project_file_path': project_file,
+                'project_folder_path': project_folder,
                 'daw_type': daw_name,
                 'detected_title': detected_title,
                 'file_size_mb': round(file_size_mb, 2),
                 'date_created': date_created,
                 'date_modified': date_modified,
-                'additional_files': json.dumps(additional_files) if additional_files else None
+                'additional_files': additional_files
             }
             
         except Exception as e:
@@ -242,46 +460,50 @@ class MusicTracker:
             print(f"No DAW projects found in {directory}")
             return 0
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        added_count = 0
+        cursor = self._conn.cursor()
+        
+        # One indexed scan of known paths instead of catching IntegrityError per row
+        cursor.execute('SELECT project_file_path FROM raw_projects')
+        existing_paths = {row[0] for row in cursor.fetchall()}
+        new_projects = [p for p in projects if p['project_file_path'] not in existing_paths]
+        
+        # Single transaction, single prepared statement for the whole batch;
+        # additional_files is only JSON-encoded here, for rows actually inserted
+        cursor.executemany('''
+            INSERT OR IGNORE INTO raw_projects 
+            (project_file_path, project_folder_path, daw_type, detected_title, 
+             file_size_mb, date_created, date_modified, additional_files)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', ((
+            project['project_file_path'],
+            project['project_folder_path'],
+            project['daw_type'],
+            project['detected_title'],
+            project['file_size_mb'],
+            project['date_created'],
+            project['date_modified'],
+            json.dumps(project['additional_files']) if project['additional_files'] else None
+        ) for project in new_projects))
+        added_count = cursor.rowcount if new_projects else 0
+        
+        self._conn.commit()
         
         for project in projects:
-            try:
-                cursor.execute('''
-                    INSERT INTO raw_projects 
-                    (project_file_path, project_folder_path, daw_type, detected_title, 
-                     file_size_mb, date_created, date_modified, additional_files)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    project['project_file_path'],
-                    project['project_folder_path'],
-                    project['daw_type'],
-                    project['detected_title'],
-                    project['file_size_mb'],
-                    project['date_created'],
-                    project['date_modified'],
-                    project['additional_files']
-                ))
-                added_count += 1
-                print(f"Added {project['daw_type']}: {project['detected_title']}")
-                
-            except sqlite3.IntegrityError:
+            if project['project_file_path'] in existing_paths:
                 print(f"Already exists: {project['detected_title']}")
-        
-        conn.commit()
-        conn.close()
+            else:
+                print(f"Added {project['daw_type']}: {project['detected_title']}")
         
         print(f"\nAdded {added_count} new projects to raw database")
         return added_count
     
-    def list_refined_projects(self, limit: int = 20, offset: int = 0, daw_filter: str = None) -> List[Dict]:
+    def list_refined_projects(self, limit: int = 20, offset: int = 0, daw_filter: str = None) -> List['sqlite3.Row']:
         """List refined/curated projects"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         query = '''
-            SELECT id, title, genre, status, rating, daw_type, file_size_mb, date_created, date_refined
+            SELECT id, title, genre, status, rating, daw_type AS daw, file_size_mb AS size_mb,
+                   date_created AS created, date_refined AS refined
             FROM refined_projects 
             WHERE 1=1
         '''
@@ -295,91 +517,77 @@ class MusicTracker:
         params.extend([limit, offset])
         
         cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        return cursor.fetchall()
+    
+    def list_raw_projects(self, limit: int = 20, offset: int = 0, daw_filter: str = None,
+                          after_id: int = None) -> List['sqlite3.Row']:
+        """List unprocessed raw projects. Pass the last ID of the previous page as
+        after_id to page by key instead of OFFSET, which re-reads skipped rows."""
+        cursor = self._conn.cursor()
+        params = []
+        
+        if daw_filter:
+            params.append(f'%{daw_filter}%')
         
-        return [dict(zip(['id', 'title', 'genre', 'status', 'rating', 'daw', 'size_mb', 'created', 'refined'], row)) for row in results]
-        """List unprocessed raw projects"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if after_id is not None:
+            params.extend([after_id, after_id, after_id])
         
+        params.extend([limit, offset])
+        
+        # Fixed statement text per filter combination, so the connection's
+        # statement cache reuses the prepared statement across calls
+        cursor.execute(_LIST_RAW_SQL[bool(daw_filter), after_id is not None], params)
+        return cursor.fetchall()
+    
+    def count_raw_projects(self, daw_filter: str = None) -> int:
+        """Count unprocessed raw projects without fetching or sorting any rows"""
         query = '''
-            SELECT id, detected_title, daw_type, file_size_mb, date_created, project_file_path
-            FROM raw_projects 
-            WHERE id NOT IN (SELECT raw_project_id FROM refined_projects WHERE raw_project_id IS NOT NULL)
-            AND id NOT IN (SELECT raw_project_id FROM rejected_projects WHERE raw_project_id IS NOT NULL)
+            SELECT COUNT(*) FROM raw_projects r
+            LEFT JOIN refined_projects ref ON ref.raw_project_id = r.id
+            LEFT JOIN rejected_projects rej ON rej.raw_project_id = r.id
+            WHERE ref.id IS NULL AND rej.id IS NULL
         '''
         params = []
         
         if daw_filter:
-            query += ' AND daw_type LIKE ?'
+            query += ' AND r.daw_type LIKE ?'
             params.append(f'%{daw_filter}%')
         
-        query += ' ORDER BY date_discovered DESC LIMIT ? OFFSET ?'
-        params.extend([limit, offset])
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
-        
-        return [dict(zip(['id', 'title', 'daw', 'size_mb', 'created', 'path'], row)) for row in results]
+        return self._conn.execute(query, params).fetchone()[0]
     
     def show_project_details(self, identifier) -> Optional[Dict]:
         """Show detailed information about a project by ID or title"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if self._details_cache is not None:
+            cached = self._details_cache.get(str(identifier))
+            if cached is not None:
+                return cached
         
-        # Try to find by ID first (if it's a number)
+        cursor = self._conn.cursor()
+        
+        # One round-trip covering both tables, by ID (if it's a number) or by title
         if str(identifier).isdigit():
             raw_id = int(identifier)
-            cursor.execute('SELECT * FROM raw_projects WHERE id = ?', (raw_id,))
-            result = cursor.fetchone()
-            
-            if result:
-                columns = [desc[0] for desc in cursor.description]
-                project_data = dict(zip(columns, result))
-                project_data['source_table'] = 'raw'
-            else:
-                # Try refined projects by ID
-                cursor.execute('SELECT * FROM refined_projects WHERE id = ?', (raw_id,))
-                result = cursor.fetchone()
-                if result:
-                    columns = [desc[0] for desc in cursor.description]
-                    project_data = dict(zip(columns, result))
-                    project_data['source_table'] = 'refined'
-                else:
-                    conn.close()
-                    return None
+            cursor.execute(_DETAILS_BY_ID_SQL, (raw_id, raw_id))
         else:
-            # Search by title in both tables
             title_pattern = f"%{identifier}%"
-            
-            # Try raw projects first
-            cursor.execute('SELECT * FROM raw_projects WHERE detected_title LIKE ? ORDER BY date_discovered DESC LIMIT 1', (title_pattern,))
-            result = cursor.fetchone()
-            
-            if result:
-                columns = [desc[0] for desc in cursor.description]
-                project_data = dict(zip(columns, result))
-                project_data['source_table'] = 'raw'
-            else:
-                # Try refined projects
-                cursor.execute('SELECT * FROM refined_projects WHERE title LIKE ? ORDER BY date_refined DESC LIMIT 1', (title_pattern,))
-                result = cursor.fetchone()
-                if result:
-                    columns = [desc[0] for desc in cursor.description]
-                    project_data = dict(zip(columns, result))
-                    project_data['source_table'] = 'refined'
-                else:
-                    conn.close()
-                    return None
+            cursor.execute(_DETAILS_BY_TITLE_SQL, (title_pattern, title_pattern))
+        
+        result = cursor.fetchone()
+        if not result:
+            return None
         
-        conn.close()
+        # Keep only the matching table's columns, as the per-table queries returned
+        source_table = result['source_table']
+        columns = RAW_DETAIL_COLUMNS if source_table == 'raw' else REFINED_DETAIL_COLUMNS
+        project_data = {column: result[column] for column in columns}
+        project_data['source_table'] = source_table
         
         # Parse additional files if present
         if 'additional_files' in project_data and project_data['additional_files']:
             project_data['additional_files'] = json.loads(project_data['additional_files'])
         
+        if self._details_cache is not None:
+            self._details_cache[str(identifier)] = project_data
         return project_data
     
     def run_analytics(self):
@@ -390,7 +598,7 @@ class MusicTracker:
             analytics.generate_report()
         except ImportError:
             print("Analytics dependencies not installed!")
-            print("Install with: pip install pandas matplotlib seaborn plotly numpy")
+            print("Install with: pip install pandas polars pyarrow matplotlib seaborn plotly numpy")
         except Exception as e:
             print(f"Error running analytics: {e}")
     
@@ -402,8 +610,7 @@ class MusicTracker:
             print(f"Raw project {raw_id} not found")
             return False
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         try:
             # Extract year from date_created if not provided
@@ -441,14 +648,13 @@ class MusicTracker:
                 raw_project['date_created']
             ))
             
-            conn.commit()
-            conn.close()
+            self._invalidate_details_cache()
+            self._conn.commit()
             print(f"Refined project: {metadata.get('title', raw_project['detected_title'])}")
             return True
             
         except Exception as e:
-            conn.rollback()
-            conn.close()
+            self._conn.rollback()
             print(f"Error refining project: {e}")
             return False
     
@@ -467,35 +673,38 @@ class MusicTracker:
             print(f"Project file not found: {project_path}")
             return False
         
+        import subprocess
+        
         try:
             print(f"Opening {title} with default program...")
             
             # Cross-platform file opening
-            system = platform.system()
-            if system == "Darwin":  # macOS
-                subprocess.run(["open", project_path], check=True)
-            elif system == "Windows":
+            if _SYSTEM == "Windows":
                 os.startfile(project_path)
-            else:  # Linux
-                subprocess.run(["xdg-open", project_path], check=True)
+            else:  # macOS `open` / Linux `xdg-open`
+                opener = _resolve_opener()
+                if opener is None:
+                    print("Failed to open project: no 'open' or 'xdg-open' command found")
+                    return False
+                # Launch without waiting so a review session isn't blocked, in its
+                # own session so the opened program outlives this terminal
+                subprocess.Popen([opener, project_path], start_new_session=True)
             
             print(f"Opened: {project_path}")
             return True
             
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to open project: {e}")
-            return False
         except Exception as e:
             print(f"Error opening project: {e}")
             return False
+    
+    def reject_project(self, raw_id: int, reason: str = "Not useful") -> bool:
         """Move project to rejected database"""
         raw_project = self.show_project_details(raw_id)
         if not raw_project:
             print(f"Raw project {raw_id} not found")
             return False
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         try:
             cursor.execute('''
@@ -507,17 +716,21 @@ class MusicTracker:
                 raw_project['detected_title'], raw_project['daw_type']
             ))
             
-            conn.commit()
-            conn.close()
+            self._invalidate_details_cache()
+            self._conn.commit()
             print(f"Rejected: {raw_project['detected_title']} - {reason}")
             return True
             
         except Exception as e:
-            conn.rollback()
-            conn.close()
+            self._conn.rollback()
             print(f"Error rejecting project: {e}")
             return False
     
+    def _invalidate_details_cache(self):
+        """Drop cached project details after a write"""
+        if self._details_cache is not None:
+            self._details_cache.clear()
+    
     def interactive_review(self, limit: int = 10):
         """Interactive mode for reviewing raw projects"""
         raw_projects = self.list_raw_projects(limit=limit)
@@ -528,49 +741,55 @@ class MusicTracker:
         
         print(f"\nFound {len(raw_projects)} unprocessed projects\n")
         
-        for i, project in enumerate(raw_projects, 1):
-            print(f"{'='*60}")
-            print(f"Project {i}/{len(raw_projects)} (ID: {project['id']})")
-            print(f"{'='*60}")
-            
-            # Show detailed info
-            details = self.show_project_details(project['id'])
-            self._display_project_details(details)
-            
-            while True:
-                print("\nOptions:")
-                print("  [r] - Refine (add to refined database)")
-                print("  [o] - Open project file")
-                print("  [x] - Reject (mark as useless)")
-                print("  [s] - Skip for now")
-                print("  [q] - Quit interactive mode")
+        # The same project is looked up several times per decision (display,
+        # refine prompt, refine itself); serve repeats from memory for the session
+        self._details_cache = {}
+        try:
+            for i, project in enumerate(raw_projects, 1):
+                print(f"{'='*60}")
+                print(f"Project {i}/{len(raw_projects)} (ID: {project['id']})")
+                print(f"{'='*60}")
                 
-                choice = input("\nChoice: ").strip().lower()
+                # Show detailed info
+                details = self.show_project_details(project['id'])
+                self._display_project_details(details)
                 
-                if choice == 'r':
-                    self._interactive_refine(project['id'])
-                    break
-                elif choice == 'o':
-                    self.open_project(project['id'])
-                    # Don't break - let user continue with other options after opening
-                    print(f"\n{'='*60}")
-                    print(f"Project {i}/{len(raw_projects)} (ID: {project['id']}) - Still reviewing")
-                    print(f"{'='*60}")
-                    self._display_project_details(details)
-                elif choice == 'x':
-                    reason = input("Reason for rejection (optional): ").strip() or "Not useful"
-                    self.reject_project(project['id'], reason)
-                    break
-                elif choice == 's':
-                    print("Skipped")
-                    break
-                elif choice == 'q':
-                    print("Exiting interactive mode")
-                    return
-                else:
-                    print("Invalid choice, please try again")
-            
-            print()
+                while True:
+                    print("\nOptions:")
+                    print("  [r] - Refine (add to refined database)")
+                    print("  [o] - Open project file")
+                    print("  [x] - Reject (mark as useless)")
+                    print("  [s] - Skip for now")
+                    print("  [q] - Quit interactive mode")
+                    
+                    choice = input("\nChoice: ").strip().lower()
+                    
+                    if choice == 'r':
+                        self._interactive_refine(project['id'])
+                        break
+                    elif choice == 'o':
+                        self.open_project(project['id'])
+                        # Don't break - let user continue with other options after opening
+                        print(f"\n{'='*60}")
+                        print(f"Project {i}/{len(raw_projects)} (ID: {project['id']}) - Still reviewing")
+                        print(f"{'='*60}")
+                        self._display_project_details(details)
+                    elif choice == 'x':
+                        reason = input("Reason for rejection (optional): ").strip() or "Not useful"
+                        self.reject_project(project['id'], reason)
+                        break
+                    elif choice == 's':
+                        print("Skipped")
+                        break
+                    elif choice == 'q':
+                        print("Exiting interactive mode")
+                        return
+                    else:
+                        print("Invalid choice, please try again")
+                
+                print()
+        finally:
+            self._details_cache = None
     
     def _display_project_details(self, details: Dict):
         """Display formatted project details"""
@@ -652,34 +871,25 @@ class MusicTracker:
     
     def stats(self):
         """Show database statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Raw projects count
-        cursor.execute('SELECT COUNT(*) FROM raw_projects')
-        raw_total = cursor.fetchone()[0]
-        
-        # Refined projects count
-        cursor.execute('SELECT COUNT(*) FROM refined_projects')
-        refined_total = cursor.fetchone()[0]
+        cursor = self._conn.cursor()
         
-        # Rejected projects count
-        cursor.execute('SELECT COUNT(*) FROM rejected_projects')
-        rejected_total = cursor.fetchone()[0]
-        
-        # Unprocessed count
+        # Totals in one statement: raw, rejected and unprocessed counts
         cursor.execute('''
-            SELECT COUNT(*) FROM raw_projects 
-            WHERE id NOT IN (SELECT raw_project_id FROM refined_projects WHERE raw_project_id IS NOT NULL)
-            AND id NOT IN (SELECT raw_project_id FROM rejected_projects WHERE raw_project_id IS NOT NULL)
+            SELECT
+                (SELECT COUNT(*) FROM raw_projects),
+                (SELECT COUNT(*) FROM rejected_projects),
+                (SELECT COUNT(*) FROM raw_projects r
+                 LEFT JOIN refined_projects ref ON ref.raw_project_id = r.id
+                 LEFT JOIN rejected_projects rej ON rej.raw_project_id = r.id
+                 WHERE ref.id IS NULL AND rej.id IS NULL)
         ''')
-        unprocessed = cursor.fetchone()[0]
+        raw_total, rejected_total, unprocessed = cursor.fetchone()
         
-        # DAW breakdown
+        # DAW breakdown (served by idx_refined_daw); its counts also give the
+        # refined total, so refined_projects is only scanned once
         cursor.execute('SELECT daw_type, COUNT(*) FROM refined_projects GROUP BY daw_type')
         daw_stats = cursor.fetchall()
-        
-        conn.close()
+        refined_total = sum(count for _, count in daw_stats)
         
         print("\nMusic Tracker Statistics")
         print("=" * 40)
@@ -694,120 +904,243 @@ class MusicTracker:
                 print(f"   {daw}: {count}")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Advanced Music Project Tracker")
-    parser.add_argument('--db', help='Custom database file path (default: platform config directory)')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Add directory command
-    add_parser = subparsers.add_parser('add', help='Add directory to scan for projects')
-    add_parser.add_argument('directory', help='Directory path to scan')
-    
-    # List raw projects command
-    list_parser = subparsers.add_parser('list', help='List unprocessed raw projects')
-    list_parser.add_argument('--limit', type=int, default=20, help='Number of projects to show')
-    list_parser.add_argument('--offset', type=int, default=0, help='Offset for pagination')
-    list_parser.add_argument('--daw', help='Filter by DAW type')
-    
-    # Show project details command
-    show_parser = subparsers.add_parser('show', help='Show detailed info for a project')
-    show_parser.add_argument('id', type=int, help='Raw project ID')
-    
-    # Interactive review command
-    review_parser = subparsers.add_parser('review', help='Interactive review of raw projects')
-    review_parser.add_argument('--limit', type=int, default=10, help='Number of projects to review')
-    
-    # Open project command
-    open_parser = subparsers.add_parser('open', help='Open project with default program')
-    open_parser.add_argument('id', type=int, help='Raw project ID')
+# Subcommand name -> (help text, argument specs as (name, add_argument options) pairs).
+# The specs drive both the plain argv parser and the argparse fallback.
+SUBCOMMANDS = {
+    'add': ('Add directory to scan for projects', (
+        ('directory', {'help': 'Directory path to scan'}),
+    )),
+    'list': ('List unprocessed raw projects', (
+        ('--limit', {'type': int, 'default': 20, 'help': 'Number of projects to show'}),
+        ('--offset', {'type': int, 'default': 0, 'help': 'Offset for pagination'}),
+        ('--after-id', {'type': int, 'help': 'Show projects after this ID (faster paging than --offset)'}),
+        ('--daw', {'help': 'Filter by DAW type'}),
+        ('--count', {'action': 'store_true', 'help': 'Only print the number of matching projects'}),
+    )),
+    'show': ('Show detailed info for a project', (
+        ('id', {'type': int, 'help': 'Raw project ID'}),
+    )),
+    'review': ('Interactive review of raw projects', (
+        ('--limit', {'type': int, 'default': 10, 'help': 'Number of projects to review'}),
+    )),
+    'open': ('Open project with default program', (
+        ('id', {'type': int, 'help': 'Raw project ID'}),
+    )),
+    'refine': ('Manually refine a project', (
+        ('id', {'type': int, 'help': 'Raw project ID'}),
+        ('--title', {'help': 'Project title'}),
+        ('--description', {'help': 'Project description'}),
+        ('--genre', {'help': 'Musical genre'}),
+        ('--bpm', {'type': int, 'help': 'Beats per minute'}),
+        ('--key', {'help': 'Key signature'}),
+        ('--status', {'default': 'complete', 'help': 'Project status'}),
+        ('--rating', {'type': int, 'help': 'Rating 1-10'}),
+        ('--tags', {'help': 'Comma-separated tags'}),
+    )),
+    'reject': ('Reject a project', (
+        ('id', {'type': int, 'help': 'Raw project ID'}),
+        ('--reason', {'default': 'Not useful', 'help': 'Rejection reason'}),
+    )),
+    'stats': ('Show database statistics', ()),
+    'version': ('Show version information', ()),
+    'analytics': ('Run analytics and generate visualizations', ()),
+}
+
+
+# refine options copied into the metadata when set: (argument name, metadata key)
+REFINE_FIELDS = (
+    ('title', 'title'),
+    ('description', 'description'),
+    ('genre', 'genre'),
+    ('bpm', 'bpm'),
+    ('key', 'key_signature'),
+    ('status', 'status'),
+    ('rating', 'rating'),
+)
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command line shapes straight from SUBCOMMANDS.
     
-    # Refine project command
-    refine_parser = subparsers.add_parser('refine', help='Manually refine a project')
-    refine_parser.add_argument('id', type=int, help='Raw project ID')
-    refine_parser.add_argument('--title', help='Project title')
-    refine_parser.add_argument('--description', help='Project description')
-    refine_parser.add_argument('--genre', help='Musical genre')
-    refine_parser.add_argument('--bpm', type=int, help='Beats per minute')
-    refine_parser.add_argument('--key', help='Key signature')
-    refine_parser.add_argument('--status', default='complete', help='Project status')
-    refine_parser.add_argument('--rating', type=int, help='Rating 1-10')
-    refine_parser.add_argument('--tags', help='Comma-separated tags')
+    Handles positionals, --option value / --option=value and store_true flags.
+    Returns None for anything else (help, usage errors, abbreviations,
+    dash-prefixed values), which main() then hands to argparse so messages and
+    exit codes stay the same.
+    """
+    values = {'db': None, 'command': None}
+    options = {'--db': {}}
+    positionals = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg.startswith('-'):
+            name, has_value, value = arg.partition('=')
+            if name not in options:
+                return None
+            spec = options[name]
+            dest = name[2:].replace('-', '_')
+            if spec.get('action') == 'store_true':
+                if has_value:
+                    return None
+                values[dest] = True
+                continue
+            if not has_value:
+                if i == len(argv) or argv[i].startswith('-'):
+                    return None
+                value = argv[i]
+                i += 1
+        elif values['command'] is None:
+            if arg not in SUBCOMMANDS:
+                return None
+            values['command'] = arg
+            specs = SUBCOMMANDS[arg][1]
+            options = {name: spec for name, spec in specs if name.startswith('-')}
+            positionals = [(name, spec) for name, spec in specs if not name.startswith('-')]
+            for name, spec in specs:
+                default = spec.get('default', False if spec.get('action') == 'store_true' else None)
+                values[name.lstrip('-').replace('-', '_')] = default
+            continue
+        elif positionals:
+            dest, spec = positionals.pop(0)
+            value = arg
+        else:
+            return None
+        
+        try:
+            values[dest] = spec.get('type', str)(value)
+        except ValueError:
+            return None
     
-    # Reject project command
-    reject_parser = subparsers.add_parser('reject', help='Reject a project')
-    reject_parser.add_argument('id', type=int, help='Raw project ID')
-    reject_parser.add_argument('--reason', default='Not useful', help='Rejection reason')
+    if values['command'] is None or positionals:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _parse_args_argparse(argv: List[str]):
+    """Full argparse parse, used for help output and usage errors"""
+    import argparse
     
-    # Stats command
-    subparsers.add_parser('stats', help='Show database statistics')
+    parser = argparse.ArgumentParser(description="Advanced Music Project Tracker")
+    parser.add_argument('--db', help='Custom database file path (default: platform config directory)')
     
-    # Version command
-    subparsers.add_parser('version', help='Show version information')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Analytics command
-    subparsers.add_parser('analytics', help='Run analytics and generate visualizations')
+    # Every subcommand is registered so top-level help and "invalid choice" errors
+    # list them all, but only the invoked one gets its arguments built
+    command = _find_command(argv)
+    for name, (help_text, arguments) in SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            for argument, options in arguments:
+                subparser.add_argument(argument, **options)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
-        return
-    
-    tracker = MusicTracker(args.db)
-    
-    if args.command == 'add':
-        tracker.add_directory(args.directory)
-    
-    elif args.command == 'list':
-        projects = tracker.list_raw_projects(args.limit, args.offset, args.daw)
-        if projects:
-            print(f"\nUnprocessed Projects (showing {len(projects)}):")
-            print("-" * 80)
-            for p in projects:
-                print(f"ID: {p['id']:3d} | {p['daw']:12s} | {p['title'][:40]:40s} | {p['size_mb']:6.1f}MB")
-        else:
-            print("No unprocessed projects found")
-    
-    elif args.command == 'show':
-        details = tracker.show_project_details(args.id)
-        if details:
-            tracker._display_project_details(details)
+        return None
+    return args
+
+
+def _find_command(argv: List[str]) -> Optional[str]:
+    """Return the first positional token of argv, i.e. the subcommand name"""
+    expects_value = False
+    for arg in argv:
+        if expects_value:
+            expects_value = False
+        elif arg.startswith('-'):
+            # --db (or an abbreviation of it) takes the next token as its value
+            expects_value = len(arg) > 2 and '--db'.startswith(arg)
         else:
-            print(f"Project {args.id} not found")
-    
-    elif args.command == 'review':
-        tracker.interactive_review(args.limit)
-    
-    elif args.command == 'open':
-        tracker.open_project(args.id)
-    
-    elif args.command == 'refine':
-        metadata = {}
-        if args.title: metadata['title'] = args.title
-        if args.description: metadata['description'] = args.description
-        if args.genre: metadata['genre'] = args.genre
-        if args.bpm: metadata['bpm'] = args.bpm
-        if args.key: metadata['key_signature'] = args.key
-        if args.status: metadata['status'] = args.status
-        if args.rating: metadata['rating'] = args.rating
-        if args.tags: metadata['tags'] = [t.strip() for t in args.tags.split(',')]
-        
-        tracker.refine_project(args.id, **metadata)
+            return arg
+    return None
+
+
+# Row layout for `list`, parsed once; takes id, daw, title (cut to 40 chars), size
+LIST_ROW_FORMAT = "ID: {:3d} | {:12s} | {:40s} | {:6.1f}MB".format
+
+
+def _handle_add(tracker: MusicTracker, args):
+    tracker.add_directory(args.directory)
+
+
+def _handle_list(tracker: MusicTracker, args):
+    if args.count:
+        print(tracker.count_raw_projects(args.daw))
+        return
     
-    elif args.command == 'reject':
-        tracker.reject_project(args.id, args.reason)
+    projects = tracker.list_raw_projects(args.limit, args.offset, args.daw, args.after_id)
+    if projects:
+        print(f"\nUnprocessed Projects (showing {len(projects)}):")
+        print("-" * 80)
+        # One write per block of rows instead of a print() call per row
+        # Rows unpack positionally in SELECT order, skipping per-column name lookups
+        lines = [LIST_ROW_FORMAT(project_id, daw, title[:40], size_mb)
+                 for project_id, title, daw, size_mb, _created, _path in projects]
+        for start in range(0, len(lines), 1000):
+            sys.stdout.write("\n".join(lines[start:start + 1000]) + "\n")
+        if len(projects) == args.limit:
+            print(f"\nNext page: --after-id {projects[-1]['id']}")
+    else:
+        print("No unprocessed projects found")
+
+
+def _handle_show(tracker: MusicTracker, args):
+    details = tracker.show_project_details(args.id)
+    if details:
+        tracker._display_project_details(details)
+    else:
+        print(f"Project {args.id} not found")
+
+
+def _handle_refine(tracker: MusicTracker, args):
+    metadata = {key: getattr(args, attr) for attr, key in REFINE_FIELDS if getattr(args, attr)}
+    if args.tags: metadata['tags'] = [t.strip() for t in args.tags.split(',')]
     
-    elif args.command == 'stats':
-        tracker.stats()
+    tracker.refine_project(args.id, **metadata)
+
+
+# Command name -> handler(tracker, args); `version` is handled in main() since it
+# needs no tracker
+HANDLERS = {
+    'add': _handle_add,
+    'list': _handle_list,
+    'show': _handle_show,
+    'review': lambda tracker, args: tracker.interactive_review(args.limit),
+    'open': lambda tracker, args: tracker.open_project(args.id),
+    'refine': _handle_refine,
+    'reject': lambda tracker, args: tracker.reject_project(args.id, args.reason),
+    'stats': lambda tracker, args: tracker.stats(),
+    'analytics': lambda tracker, args: tracker.run_analytics(),
+}
+
+
+def main():
+    argv = sys.argv[1:]
+    # Bare `version` and `stats` take no options, so skip parsing entirely.
+    # Must produce exactly what the parsers would for these argv shapes.
+    if argv == ['version'] or argv == ['stats']:
+        args = SimpleNamespace(db=None, command=argv[0])
+    else:
+        args = _parse_args_fast(argv) or _parse_args_argparse(argv)
+    if args is None:
+        return
     
-    elif args.command == 'version':
+    # version needs no database: report the path without connecting to it
+    if args.command == 'version':
+        db_path = args.db if args.db is not None else str(_config_dir() / "music_tracker.db")
         print(f"Music Tracker v{__version__}")
         print("Advanced CLI tool for tracking DAW music projects")
-        print(f"Database location: {tracker.db_path}")
+        print(f"Database location: {db_path}")
+        return
+    
+    tracker = MusicTracker(args.db)
     
-    elif args.command == 'analytics':
-        tracker.run_analytics()
+    try:
+        HANDLERS[args.command](tracker, args)
+    finally:
+        tracker.close()
 
 
 if __name__ == '__main__':